@@ -0,0 +1,5 @@
+from importlib.util import find_spec
+
+if find_spec("numba") is None:
+    # optional dependency; the kernels module cannot be imported without it
+    collect_ignore = ["streq/_kernels.py"]
@@ -1,3 +1,4 @@
+from .batch import *
 from .circular import Circular
 from .distance import *
 from .seqtools import *
@@ -0,0 +1,179 @@
+"""Numba-compiled kernels for hot loops in streq.
+
+Importing this module raises ImportError if numba is not installed,
+in which case callers fall back to NumPy implementations.
+
+"""
+
+from numba import njit, prange
+import numpy as np
+
+
+@njit(cache=True, boundscheck=False)
+def _myers_blocks(x: np.ndarray,
+                  y: np.ndarray) -> int:
+
+    """Levenshtein distance by Myers' bit-parallel algorithm, 
+    for patterns y of any length.
+
+    The pattern is split over as many 64-bit words as needed, 
+    carrying additions and shifts between words.
+
+    """
+
+    m = y.size
+
+    if m == 0:
+        return x.size
+
+    n_words = (m + 63) // 64
+    zero = np.uint64(0)
+    one = np.uint64(1)
+    top = np.uint64(63)
+    high = one << np.uint64((m - 1) % 64)
+
+    peq = np.zeros((256, n_words), np.uint64)
+    for i in range(m):
+        peq[y[i], i // 64] |= one << np.uint64(i % 64)
+
+    vp = np.empty(n_words, np.uint64)
+    vn = np.zeros(n_words, np.uint64)
+    for w in range(n_words):
+        vp[w] = ~zero
+
+    score = m
+
+    for i in range(x.size):
+
+        peq_x = peq[x[i]]
+        add_carry = zero
+        hp_carry = one
+        hn_carry = zero
+
+        for w in range(n_words):
+
+            vp_w = vp[w]
+            vn_w = vn[w]
+
+            eq = peq_x[w] | vn_w
+            total = vp_w + (eq & vp_w)
+            overflow = total < vp_w
+            total += add_carry
+            add_carry = one if (overflow or total < add_carry) else zero
+
+            d0 = (total ^ vp_w) | eq
+            hn = vp_w & d0
+            hp = vn_w | ~(vp_w | d0)
+
+            if w == n_words - 1:
+                if hp & high:
+                    score += 1
+                elif hn & high:
+                    score -= 1
+
+            hp_shifted = (hp << one) | hp_carry
+            hn_shifted = (hn << one) | hn_carry
+            hp_carry = hp >> top
+            hn_carry = hn >> top
+
+            vn[w] = hp_shifted & d0
+            vp[w] = hn_shifted | ~(hp_shifted | d0)
+
+    return score
+
+
+@njit(cache=True, boundscheck=False)
+def _myers(x: np.ndarray,
+           y: np.ndarray) -> int:
+
+    """Levenshtein distance by Myers' bit-parallel algorithm.
+
+    The pattern y must be no longer than 64 bytes, so that 
+    it fits in a single machine word.
+
+    """
+
+    m = y.size
+
+    if m == 0:
+        return x.size
+
+    one = np.uint64(1)
+    high = one << np.uint64(m - 1)
+
+    peq = np.zeros(256, np.uint64)
+    for i in range(m):
+        peq[y[i]] |= one << np.uint64(i)
+
+    vp = ~np.uint64(0)
+    vn = np.uint64(0)
+    score = m
+
+    for i in range(x.size):
+
+        eq = peq[x[i]] | vn
+        d0 = ((vp + (eq & vp)) ^ vp) | eq
+        hn = vp & d0
+        hp = vn | ~(vp | d0)
+
+        if hp & high:
+            score += 1
+        elif hn & high:
+            score -= 1
+
+        eq = (hp << one) | one
+        vn = eq & d0
+        vp = (hn << one) | ~(eq | d0)
+
+    return score
+
+
+@njit(cache=True, parallel=True, boundscheck=False)
+def _corr_kernel(x_arr: np.ndarray,
+                 y_arr: np.ndarray,
+                 len_x: int,
+                 max_len: int,
+                 mismatch_lut: np.ndarray) -> float:
+
+    """Sum of match proportions of y against x shifted 
+    by each offset, as in `streq.distance.correlation`.
+
+    mismatch_lut[a, b] is 1 if bytes a and b count as 
+    a mismatch, else 0.
+
+    """
+
+    len_y = y_arr.size
+    terms = np.empty(len_x, np.float64)
+
+    for n in prange(len_x):
+
+        mismatches = 0
+
+        for j in range(min(len_x - n, len_y)):
+            mismatches += mismatch_lut[x_arr[n + j], y_arr[j]]
+
+        terms[n] = ((max_len - n) - mismatches) / (max_len - n)
+
+    # sum in order, to match the pure Python result exactly
+    total = 0.
+    for n in range(len_x):
+        total += terms[n]
+
+    return total
+
+
+def _warm_up() -> None:
+
+    """Compile kernels at import rather than on first call.
+
+    """
+
+    example = np.frombuffer(b'ACGT', dtype=np.uint8)
+    _myers(example, example)
+    _myers_blocks(example, example)
+    _corr_kernel(example, example, example.size, example.size,
+                 np.zeros((256, 256), dtype=np.uint8))
+
+
+_warm_up()
@@ -0,0 +1,65 @@
+"""Functions for transforming many equal-length sequences at once."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+import numpy as np
+
+from .seqtools import _COMPL_BYTES
+from .utils import _to_array
+
+_COMPL_ARRAY = np.frombuffer(_COMPL_BYTES, dtype=np.uint8)
+
+
+def reverse_complement_batch(reads: Iterable[str]) -> np.ndarray:
+
+    """Reverse complement many sequences of identical length.
+
+    The sequences are stacked into a single array of bytes, one
+    row per sequence, so the transformation is vectorized over
+    all of them. Case is preserved.
+
+    Parameters
+    ----------
+    reads : list of str
+        Sequences to convert. Must all be the same length.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of uint8 with one row per converted sequence.
+
+    Raises
+    ------
+    ValueError
+        If the sequences are not all the same length, or contain
+        non-ASCII characters.
+
+    Examples
+    --------
+    >>> rc = reverse_complement_batch(['ATCG', 'AAAt'])
+    >>> rc
+    array([[67, 71, 65, 84],
+           [97, 84, 84, 84]], dtype=uint8)
+    >>> [row.tobytes().decode() for row in rc]
+    ['CGAT', 'aTTT']
+    >>> reverse_complement_batch(['ACGé'])
+    Traceback (most recent call last):
+    ...
+    ValueError: Sequences must be ASCII.
+
+    """
+
+    reads = list(reads)
+    read_len = len(reads[0]) if len(reads) > 0 else 0
+
+    if any(len(read) != read_len for read in reads):
+        raise ValueError("Sequences must all be the same length.")
+
+    if not all(read.isascii() for read in reads):
+        raise ValueError("Sequences must be ASCII.")
+
+    stacked = _to_array(''.join(reads)).reshape(len(reads), read_len)
+
+    return _COMPL_ARRAY[stacked[:, ::-1]]
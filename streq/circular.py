@@ -53,6 +53,19 @@ class Circular(str):
             start = __key.start or 0
             stop = (len(self) if __key.stop is None 
                     else __key.stop) 
+            length = stop - start
 
-            return (super().__getitem__(slice(start, None)) + self)[:(stop - start)][::__key.step]
+            if 0 <= start <= stop <= len(self):
+
+                # no wrapping, so no need to concatenate
+                return super().__getitem__(slice(start, stop))[::__key.step]
+            
+            elif length >= 0:
+
+                tail = super().__getitem__(slice(start, None))
+                head = super().__getitem__(slice(max(length - len(tail), 0)))
+
+                return (tail + head)[:length][::__key.step]
+
+            return (super().__getitem__(slice(start, None)) + self)[:length][::__key.step]
         
\ No newline at end of file
@@ -2,17 +2,35 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from difflib import SequenceMatcher
 from functools import partial
 
+import numpy as np
+
 from .seqtools import reverse_complement
-from .utils import _normalize_case
+from .utils import _MIN_ARRAY_LENGTH, _normalize_case, _to_array, _to_upper
+
+try:
+    from . import _kernels
+except ImportError:
+    _kernels = None
+
+_WORD_SIZE = 64
+
+# _WOBBLE[a, b] is 1 if bytes a and b form a G.U wobble pair, where b 
+# is from the reverse complement
+_WOBBLE = np.zeros((256, 256), dtype=np.uint8)
+_WOBBLE[ord('G'), ord('A')] = 1
+_WOBBLE[[ord('T'), ord('U')], ord('C')] = 1
+
+_MISMATCH = (np.arange(256)[:, np.newaxis] != np.arange(256)).astype(np.uint8)
+_MISMATCH_WOBBLE = _MISMATCH - _WOBBLE
 
 @_normalize_case(nargs=2)
 def levenshtein(x: str, y: str) -> int:
 
-	"""Calculate the Levenshtein distance between two sequences.
+    """Calculate the Levenshtein distance between two sequences.
     
     The Levenshtein distance is the number of insertions,
     deletions, and mutations required to make two 
@@ -40,38 +58,102 @@ def levenshtein(x: str, y: str) -> int:
     1
     >>> levenshtein('AAAG', 'TCGA')
     4
+    >>> levenshtein('', 'TCGA')
+    4
+    >>> levenshtein('ACGé' * 20, 'ACGT' * 20)
+    20
+    >>> levenshtein('ACGT' * 25, 'ACGT' * 20)
+    20
+    >>> levenshtein('ACGT' * 25, 'ACGT' * 24 + 'AGT')
+    1
+    >>> levenshtein('ACGT' * 50, 'ACGT' * 33 + 'AGT' + 'ACGT' * 16)
+    1
+    >>> levenshtein('A' * 200, 'A' * 127 + 'CCC' + 'A' * 70)
+    3
 
     """
-    
-	x_len, y_len = map(len, (x, y))
 
-	matrix = {i: {j: 0 for j in range(y_len + 1)} 
-			  for i in range(x_len + 1)}
-	
-	for i in range(x_len + 1):
+    # keep the shorter sequence along the rows, so memory is O(min(m, n))
+    if len(y) > len(x):
+        x, y = y, x
+
+    short = len(y) <= _WORD_SIZE
+
+    if (_kernels is None and short) or not (x.isascii() and y.isascii()):
+        return _myers(x, y)
+
+    x_arr, y_arr = map(_to_array, (x, y))
+
+    if _kernels is None:
+        return _wagner_fischer(x_arr, y_arr)
+    elif short:
+        return int(_kernels._myers(x_arr, y_arr))
+    else:
+        return int(_kernels._myers_blocks(x_arr, y_arr))
+
+
+def _myers(x: str, 
+           y: str) -> int:
+
+    # Myers' bit-parallel algorithm: bit i of each vector holds the 
+    # vertical delta of row i of the DP matrix, so a whole column is 
+    # updated with a handful of word operations. y is the pattern.
+    # Python ints are unbounded, so any length of pattern works.
+    m = len(y)
+
+    if m == 0:
+        return len(x)
+
+    mask = (1 << m) - 1
+    high = 1 << (m - 1)
+
+    peq = {}
+    for i, letter in enumerate(y):
+        peq[letter] = peq.get(letter, 0) | (1 << i)
 
-		matrix[i][0] = i
-	
-	for j in range(y_len + 1):
+    vp, vn, score = mask, 0, m
 
-		matrix[0][j] = j
+    for letter in x:
 
-	for i in range(1, x_len + 1):
-		
-		for j in range(1, y_len + 1):
-			
-			if x[i - 1] == y[j - 1]:
-				
-				matrix[i][j] = matrix[i - 1][j - 1]
-			
-			else:
-				
-				minimum = min(matrix[i - 1][j], 
-							  matrix[i][j - 1], 
-							  matrix[i - 1][j - 1])
-				matrix[i][j] = minimum + 1
+        eq = peq.get(letter, 0) | vn
+        d0 = (((vp + (eq & vp)) ^ vp) | eq) & mask
+        hn = vp & d0
+        hp = vn | (~(vp | d0) & mask)
 
-	return matrix[x_len][y_len]
+        if hp & high:
+            score += 1
+        elif hn & high:
+            score -= 1
+
+        eq = ((hp << 1) | 1) & mask
+        vn = eq & d0
+        vp = ((hn << 1) | ~(eq | d0)) & mask
+
+    return score
+
+
+def _wagner_fischer(x: np.ndarray, 
+                    y: np.ndarray) -> int:
+
+    # Two rolling rows of the DP matrix. Substitutions and deletions
+    # depend only on the previous row, so are vectorized; insertions
+    # chain along the current row, which is a running minimum of
+    # (cell - column index).
+    offsets = np.arange(y.size + 1, dtype=np.int32)
+    previous = offsets.copy()
+    current = np.empty_like(previous)
+
+    for i, letter in enumerate(x, start=1):
+
+        cost = (y != letter).astype(np.int32)
+        current[0] = i
+        np.minimum(previous[1:] + 1, previous[:-1] + cost, 
+                   out=current[1:])
+        np.minimum.accumulate(current - offsets, out=current)
+        current += offsets
+        previous, current = current, previous
+
+    return int(previous[-1])
 
 
 @_normalize_case(nargs=2)
@@ -103,10 +185,82 @@ def hamming(x: str, y: str) -> int:
     2
     >>> hamming('AAA', 'TTT')
     3
+    >>> hamming('AAAT', 'ATT')
+    2
+    >>> hamming('ACGé', 'ACGT')
+    1
+    >>> hamming('ACGT' * 20, 'ACGA' * 20)
+    20
 
     """
     
-    return sum(a != b for a, b in zip(x, y))
+    n = min(len(x), len(y))
+
+    if n < _MIN_ARRAY_LENGTH or not (x.isascii() and y.isascii()):
+        return sum(a != b for a, b in zip(x, y))
+
+    x_arr, y_arr = map(_to_array, (x, y))
+
+    return int(np.count_nonzero(x_arr[:n] != y_arr[:n]))
+
+
+@_normalize_case(nargs=1)
+def hamming_batch(query: str, 
+                  refs: Sequence[str]) -> np.ndarray:
+    
+    """Calculate the Hamming distances between one query and many sequences.
+    
+    All reference sequences must have the same length. As with 
+    `hamming`, the query and references are truncated to the 
+    shortest length.
+
+    Parameters
+    ----------
+    query : str
+        Sequence.
+    refs : list of str
+        Reference sequences of identical length to compare with query.
+
+    Returns
+    -------
+    numpy.ndarray
+        Hamming distance of each reference from query.
+
+    Raises
+    ------
+    ValueError
+        If the reference sequences are not all the same length
+        after conversion to uppercase.
+
+    Examples
+    --------
+    >>> hamming_batch('AAA', ['ATA', 'ATT', 'ttt'])
+    array([1, 2, 3], dtype=int32)
+    >>> hamming_batch('AAA', ['AT', 'TT'])
+    array([1, 2], dtype=int32)
+    >>> hamming_batch('ACGé', ['ACGT', 'ACGÉ'])
+    array([1, 0], dtype=int32)
+    >>> hamming_batch('AAA', ['ßA', 'CC'])
+    Traceback (most recent call last):
+    ...
+    ValueError: Reference sequences must all be the same length.
+
+    """
+
+    refs = [_to_upper(ref) for ref in refs]
+    ref_len = len(refs[0]) if len(refs) > 0 else len(query)
+
+    if any(len(ref) != ref_len for ref in refs):
+        raise ValueError("Reference sequences must all be the same length.")
+
+    if not (query.isascii() and all(ref.isascii() for ref in refs)):
+        return np.array([hamming(query, ref) for ref in refs], dtype=np.int32)
+
+    n = min(len(query), ref_len)
+    stack = _to_array(''.join(refs)).reshape(len(refs), ref_len)
+    query_arr = _to_array(query)
+
+    return (stack[:, :n] != query_arr[:n]).sum(axis=1, dtype=np.int32)
 
 
 @_normalize_case(nargs=2)
@@ -144,18 +298,70 @@ def ratcliff_obershelp(x: str,
     
     """
     
-	sm = SequenceMatcher(a=x, b=y, 
-                         autojunk=False).get_opcodes()
+	blocks = SequenceMatcher(a=x, b=y, 
+                             autojunk=False).get_matching_blocks()
+
+	# each gap before a matching block (including the final, empty
+	# block) is one non-equal opcode
+	edits, i, j = 0, 0, 0
     
-	return sum(code[0] != 'equal' for code in sm)
+	for a, b, size in blocks:
+		edits += (i < a or j < b)
+		i, j = a + size, b + size
+
+	return edits
 
 def mismatch_fun(x, y, n, wobble):
+
+    """Count mismatches between x, offset by n, and y.
+
+    Parameters
+    ----------
+    x : str or numpy.ndarray
+        Sequence, or its bytes.
+    y : str or numpy.ndarray
+        Second sequence, or its bytes.
+    n : int
+        Offset into x.
+    wobble : bool
+        Whether G.A and T/U.C pairs are not counted as mismatches.
+
+    Returns
+    -------
+    int
+        Number of mismatches.
+
+    Examples
+    --------
+    >>> mismatch_fun('acgt', 'ACGT', 0, False)
+    0
+    >>> mismatch_fun('ggga', 'CCCA', 0, True)
+    3
+    >>> mismatch_fun('gguu', 'AACC', 0, True)
+    0
+
+    """
+
+    if isinstance(x, str):
+
+        pairs = zip(_to_upper(x)[n:], _to_upper(y))
+
+        if wobble:
+            return sum(a != b and not ((a == 'G' and b == 'A') or (a in 'TU' and b == 'C')) 
+                       for a, b in pairs)
+        
+        return sum(a != b for a, b in pairs)
+
+    n_bases = min(x.size - n, y.size)
+    x, y = x[n:(n + n_bases)], y[:n_bases]
+
+    if wobble:
+        return int(_MISMATCH_WOBBLE[x, y].sum())
     
-    wobbles = sum(wobble and ((a == 'G' and b == 'A') or (a in 'TU' and b == 'C')) for a, b in zip(x[n:], y))
-    return hamming(x[n:], y) - wobbles
+    return int(np.count_nonzero(x != y))
 
 
-def _mismatch_fun(wobble: bool = False) -> Callable[[str, str, int], int]:
+def _mismatch_fun(wobble: bool = False) -> Callable[[np.ndarray, np.ndarray, int], int]:
 
     return  partial(mismatch_fun, wobble=wobble)
 
@@ -217,17 +423,30 @@ def correlation(x: str,
     0.0
     >>> correlation('GGG', 'UUU', wobble=True)
     3.0
+    >>> correlation('GGG', 'UUU', True)
+    3.0
+    >>> correlation('ACGé')
+    1.5
 
     """
     
-    x = x
     y = reverse_complement(y or x)
 
     len_x = len(x)
 
     max_len = min(len_x, len(y))
 
-    mismatch_fun = _mismatch_fun(wobble=wobble)
+    is_ascii = x.isascii() and y.isascii()
+
+    if is_ascii and _kernels is not None and len_x == max_len:
+        return _kernels._corr_kernel(_to_array(x), _to_array(y), 
+                                     len_x, max_len, 
+                                     _MISMATCH_WOBBLE if wobble else _MISMATCH)
+    elif max_len < _MIN_ARRAY_LENGTH or not is_ascii:
+        mismatch_fun = partial(_mismatch_fun(wobble=wobble), x, y)
+    else:
+        mismatch_fun = partial(_mismatch_fun(wobble=wobble), 
+                               _to_array(x), _to_array(y))
 	    
-    return sum(((max_len - n) - mismatch_fun(x, y, n)) / (max_len - n)
+    return sum(((max_len - n) - mismatch_fun(n)) / (max_len - n)
                 for n in range(len_x))
\ No newline at end of file
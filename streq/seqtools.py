@@ -8,15 +8,35 @@ calculations on nucleotide sequences.
 from __future__ import annotations
 
 from collections.abc import Generator, Sequence
+from functools import lru_cache
 import re
 
+import numpy as np
+
+from .circular import Circular
 from .utils import (sequences, 
+                    _MIN_ARRAY_LENGTH, 
                     _preserve_case, 
                     _preserve_circular,
-                    _normalize_case)
+                    _normalize_case,
+                    _to_array,
+                    _uppercase_fast_path)
 
 seqs = sequences
 
+# bound once, to skip attribute lookups in hot functions
+_COMPLEMENTER = seqs.complementer
+_BASE2REGEX = seqs.base2regex
+_RE_SITES = seqs.re_sites
+
+# complement both cases in one C-level byte translation
+_COMPL_BYTES = bytes.maketrans(
+    bytes(key for key in _COMPLEMENTER) 
+    + bytes(key for key in _COMPLEMENTER).lower(),
+    ''.join(_COMPLEMENTER.values()).encode('ascii') 
+    + ''.join(_COMPLEMENTER.values()).lower().encode('ascii'),
+)
+
 
 @_preserve_circular
 def reverse(x: str) -> str:
@@ -38,6 +58,7 @@ def reverse(x: str) -> str:
     return x[::-1]
 
 
+@_uppercase_fast_path
 @_preserve_circular
 @_preserve_case
 @_normalize_case(nargs=1)
@@ -57,7 +78,7 @@ def complement(x: str) -> str:
 
     """
 
-    return x.translate(seqs.complementer)
+    return x.translate(_COMPLEMENTER)
 
 
 def reverse_complement(x: str) -> str:
@@ -78,12 +99,20 @@ def reverse_complement(x: str) -> str:
     --------
     >>> reverse_complement('ATCG')
     'CGAT'
+    >>> reverse_complement('ATCg')
+    'cGAT'
 
     """
 
-    return complement(reverse(x))
+    if not x.isascii():
+        return complement(reverse(x))
+
+    rc = x.encode('ascii').translate(_COMPL_BYTES)[::-1].decode('ascii')
+
+    return Circular(rc) if isinstance(x, Circular) else rc
 
 
+@_uppercase_fast_path
 @_preserve_circular
 @_preserve_case
 @_normalize_case(nargs=1)
@@ -105,12 +134,15 @@ def to_rna(x: str) -> str:
     --------
     >>> to_rna('ATCG')
     'AUCG'
+    >>> to_rna('ATCg' * 50)[-8:]
+    'AUCgAUCg'
 
     """
 
     return x.replace('T', 'U')
 
 
+@_uppercase_fast_path
 @_preserve_circular
 @_preserve_case
 @_normalize_case(nargs=1)
@@ -138,6 +170,12 @@ def to_dna(x: str) -> str:
     return x.replace('U', 'T')
 
 
+@lru_cache(maxsize=256)
+def _compile_iupac(query: str) -> re.Pattern:
+
+    return re.compile(query.translate(_BASE2REGEX))
+
+
 @_normalize_case(nargs=2)
 def find_iupac(query: str, 
                sequence: str) -> Generator[Sequence[int], str]:
@@ -187,14 +225,17 @@ def find_iupac(query: str,
 
     """
     
-    query = query.translate(seqs.base2regex)
-    query = re.compile(query) 
+    query = _compile_iupac(query)
     
     for match in query.finditer(sequence):
 
         yield match.span(), match.group()
 
 
+_RE_SITES_BOTH = tuple((enz, site, reverse_complement(site)) 
+                       for enz, site in _RE_SITES.items())
+
+
 @_normalize_case(nargs=1)
 def which_re_sites(x: str) -> Sequence[str]:
 
@@ -231,9 +272,8 @@ def which_re_sites(x: str) -> Sequence[str]:
     
     """
 
-    fwd = [enz for enz, site in seqs.re_sites.items() 
-           if (site in x) or 
-           (reverse_complement(site) in x)]
+    fwd = [enz for enz, site, rc_site in _RE_SITES_BOTH 
+           if (site in x) or (rc_site in x)]
 
     return tuple(fwd)
 
@@ -277,11 +317,25 @@ def count_re_sites(x: str) -> bool:
     return len(which_re_sites(x))
     
 
+@lru_cache(maxsize=None)
+def _membership_table(y: str) -> np.ndarray:
+
+    table = np.zeros(256, dtype=np.uint8)
+    table[_to_array(y)] = 1
+
+    return table
+
+
 @_normalize_case(nargs=2)
 def _x_content(x: str, y: str) -> float:
 
     try:
-        return sum(letter in y for letter in x) / len(x)
+
+        if len(x) < _MIN_ARRAY_LENGTH or not x.isascii():
+            return sum(letter in y for letter in x) / len(x)
+
+        return int(np.count_nonzero(_membership_table(y)[_to_array(x)])) / len(x)
+
     except ZeroDivisionError:
         return 0. 
     
@@ -306,6 +360,10 @@ def gc_content(x: str) -> float:
     --------
     >>> gc_content('AGGG')
     0.75
+    >>> gc_content('ñacg')
+    0.5
+    >>> gc_content('AGGG' * 20)
+    0.75
 
     """
 
@@ -5,8 +5,10 @@ from __future__ import annotations
 from collections import namedtuple
 from collections.abc import Callable, Sequence
 from functools import wraps
+from inspect import unwrap
 import os
 
+import numpy as np
 import yaml
 
 from .circular import Circular
@@ -32,6 +34,33 @@ SequenceCollection = namedtuple('SequenceCollection',
 sequences = SequenceCollection(**sequence_dict)
 
 
+# below this length, generator loops beat the NumPy call overhead
+_MIN_ARRAY_LENGTH = 48
+
+
+def _to_array(x: str) -> np.ndarray:
+
+    """View an ASCII sequence as an array of bytes.
+    
+    """
+
+    return np.frombuffer(x.encode('ascii'), dtype=np.uint8)
+
+
+# below this length, per-character loops beat the NumPy call overhead
+_MIN_CASE_MASK_LENGTH = 150
+
+
+def _is_lower(x: np.ndarray) -> np.ndarray:
+
+    return (x >= ord('a')) & (x <= ord('z'))
+
+
+def _is_upper(x: np.ndarray) -> np.ndarray:
+
+    return (x >= ord('A')) & (x <= ord('Z'))
+
+
 def _make_lower(x: str, 
                 lower: Sequence[bool]):
     
@@ -40,6 +69,15 @@ def _make_lower(x: str,
                    for letter, low in zip(x, lower))
 
 
+def _to_upper(x: str) -> str:
+
+    if x.isascii():
+        # avoid copying sequences which are already uppercase
+        return x if x.isupper() else x.upper()
+    
+    return x.casefold().upper()
+
+
 def _normalize_case(nargs: int = 1) -> Callable[[Callable], Callable]:
     
     def decor(f: Callable[[str, str], 
@@ -49,8 +87,8 @@ def _normalize_case(nargs: int = 1) -> Callable[[Callable], Callable]:
         @wraps(f)
         def normalized(*args, **kwargs):
 
-            args = (x.casefold().upper() 
-                    for i, x in enumerate(args) if i < nargs)
+            args = [_to_upper(x) if i < nargs and isinstance(x, str) else x
+                    for i, x in enumerate(args)]
             
             return f(*args, **kwargs)
         
@@ -66,12 +104,28 @@ def _preserve_case(f: Callable[[str],
     @wraps(f)
     def preserved(x: str, 
                   *args, **kwargs):
-        
-        is_lower = (letter.islower() for letter in x)
 
-        x = f(x.casefold().upper(), *args, **kwargs)
+        if len(x) < _MIN_CASE_MASK_LENGTH or not x.isascii():
+
+            is_lower = (letter.islower() for letter in x)
+
+            x = f(x.casefold().upper(), *args, **kwargs)
+            
+            return _make_lower(x, is_lower)
         
-        return _make_lower(x, is_lower)
+        is_lower = _is_lower(_to_array(x))
+
+        x = f(x.upper(), *args, **kwargs)
+
+        if not x.isascii() or len(x) != is_lower.size:
+            return _make_lower(x, is_lower)
+        elif not is_lower.any():
+            return x
+
+        x_arr = _to_array(x).copy()
+        x_arr[is_lower & _is_upper(x_arr)] += 32
+
+        return x_arr.tobytes().decode('ascii')
     
     preserved.__doc__ = (f.__doc__ or '') + (
     """
@@ -108,4 +162,30 @@ def _preserve_circular(f: Callable[[str],
     """
     )
     
-    return preserved
\ No newline at end of file
+    return preserved
+
+
+def _uppercase_fast_path(f: Callable[[str], 
+                                     str]) -> Callable[[str], 
+                                                       str]:
+
+    """Bypass case and circularity decorators for plain uppercase ASCII.
+
+    Such input is unchanged by those decorators, so the undecorated
+    function is called directly.
+
+    """
+
+    undecorated = unwrap(f)
+    
+    @wraps(f)
+    def dispatched(x: str, 
+                   *args, **kwargs):
+
+        if type(x) is str and x.isascii() and x.isupper():
+
+            return undecorated(x, *args, **kwargs)
+        
+        return f(x, *args, **kwargs)
+    
+    return dispatched
@@ -3,7 +3,8 @@ import streq as sq
 
 if __name__ == '__main__':
 
+    doctest.testmod(sq.batch)
     doctest.testmod(sq.circular)
     doctest.testmod(sq.distance)
     doctest.testmod(sq.seqtools)
-    doctest.testmod(sq.utils)
\ No newline at end of file
+    doctest.testmod(sq.utils)